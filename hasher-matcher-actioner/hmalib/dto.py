@@ -13,10 +13,27 @@ Classes in this module should implement methods `to_dynamodb_item(self)` and
 
 class DynamoDBItem():
 
+  # Empty so that slotted subclasses don't also get a per-instance __dict__
+  __slots__ = ()
+
   def write_to_table(self, table: Table):
+    """
+    Writes a single item. Prefer write_many when writing several items in one
+    invocation.
+    """
     table.put_item(Item=self.to_dynamodb_item())
 
-  def to_dynamo_db_item(self) -> t.Dict:
+  @classmethod
+  def write_many(cls, table: Table, items: t.Iterable["DynamoDBItem"]):
+    """
+    Writes items using BatchWriteItem (up to 25 items per call). Items sharing a
+    PK and SK within a batch are de-duplicated, last write wins.
+    """
+    with table.batch_writer(overwrite_by_pkeys=["PK", "SK"]) as batch:
+      for item in items:
+        batch.put_item(Item=item.to_dynamodb_item())
+
+  def to_dynamodb_item(self) -> t.Dict:
     raise NotImplementedError
 
 
@@ -24,8 +41,13 @@ class DynamoDBItem():
 class PDQRecordBase(DynamoDBItem):
     """
     Abstract Base Record for PDQ releated items.
+
+    dataclass(slots=True) needs python 3.10, so __slots__ are declared by hand
+    on this class and its subclasses. Each must list the fields it adds.
     """
 
+    __slots__ = ("content_key", "content_hash", "timestamp")
+
     SIGNAL_TYPE = "pdq"
 
     content_key: str
@@ -40,10 +62,6 @@ class PDQRecordBase(DynamoDBItem):
     def get_dynamodb_type_key(key: str):
         return f"type#{key}"
 
-    @staticmethod
-    def get_dynamodb_type_key(key: str):
-        return f"type#{key}"
-
     def to_dynamodb_item(self) -> dict:
         raise NotImplementedError
 
@@ -57,6 +75,8 @@ class PipelinePDQHashRecord(PDQRecordBase):
     Successful execution at the hasher produces this record.
     """
 
+    __slots__ = ("quality",)
+
     quality: int
 
     def to_dynamodb_item(self) -> dict:
@@ -83,6 +103,8 @@ class PDQMatchRecord(PDQRecordBase):
     Successful execution at the matcher produces this record.
     """
 
+    __slots__ = ("te_id", "te_hash")
+
     te_id: int
     te_hash: str
 
@@ -7,9 +7,12 @@ import tempfile
 from pathlib import Path
 from urllib.parse import unquote_plus
 import datetime
+import time
+import typing as t
 
 import boto3
 from mypy_boto3_dynamodb import DynamoDBServiceResource
+from mypy_boto3_sqs.type_defs import SendMessageBatchRequestEntryTypeDef
 from threatexchange.hashing import pdq_hasher
 
 from hmalib import metrics
@@ -25,6 +28,60 @@ dynamodb: DynamoDBServiceResource = boto3.resource("dynamodb")
 OUTPUT_QUEUE_URL = os.environ["PDQ_HASHES_QUEUE_URL"]
 DYNAMODB_TABLE = os.environ["DYNAMODB_TABLE"]
 
+# SendMessageBatch accepts at most 10 entries per call
+SQS_MAX_BATCH_SIZE = 10
+SQS_MAX_SEND_ATTEMPTS = 3
+# Doubled after every failed attempt
+SQS_RETRY_BACKOFF_SECONDS = 0.1
+
+
+def send_message_batch(entries: t.List[SendMessageBatchRequestEntryTypeDef]):
+    """
+    Publishes up to SQS_MAX_BATCH_SIZE entries to the output queue in a single
+    call. SQS can partially fail a batch, in which case only the failed entries
+    are resent after a backoff. Entries SQS rejects as sender faults will never
+    succeed, so those raise immediately.
+    """
+    for attempt in range(1, SQS_MAX_SEND_ATTEMPTS + 1):
+        response = sqs_client.send_message_batch(
+            QueueUrl=OUTPUT_QUEUE_URL, Entries=entries
+        )
+        failures = response.get("Failed", [])
+        if not failures:
+            return
+
+        sender_faults = [failure for failure in failures if failure["SenderFault"]]
+        if sender_faults:
+            raise RuntimeError(
+                f"SQS rejected {len(sender_faults)} entries, "
+                f"first error: {sender_faults[0]['Code']}"
+            )
+
+        if attempt == SQS_MAX_SEND_ATTEMPTS:
+            break
+
+        failed_ids = {failure["Id"] for failure in failures}
+        logger.warning("Resending %d failed SQS entries", len(failed_ids))
+        entries = [entry for entry in entries if entry["Id"] in failed_ids]
+        time.sleep(SQS_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+
+    raise RuntimeError(f"Failed to publish {len(failures)} entries to SQS")
+
+
+def publish_hash_records(records_table, hash_records: t.List[PipelinePDQHashRecord]):
+    """
+    Writes a batch of hash records to dynamodb, then publishes them to the
+    output queue. SQS only requires entry Ids to be unique within one request,
+    so they are numbered per batch.
+    """
+    PipelinePDQHashRecord.write_many(records_table, hash_records)
+    send_message_batch(
+        [
+            {"Id": str(i), "MessageBody": json.dumps(record.to_sqs_message())}
+            for i, record in enumerate(hash_records)
+        ]
+    )
+
 
 def lambda_handler(event, context):
     """
@@ -45,6 +102,8 @@ def lambda_handler(event, context):
     """
 
     records_table = dynamodb.Table(DYNAMODB_TABLE)
+    pending_records: t.List[PipelinePDQHashRecord] = []
+    published_count = 0
 
     for sqs_record in event["Records"]:
         sns_notification = json.loads(sqs_record["body"])
@@ -77,14 +136,17 @@ def lambda_handler(event, context):
                     key, pdq_hash, datetime.datetime.now(), quality
                 )
 
-                hash_record.write_to_table(records_table)
+                # Written to dynamodb and published to SQS in batches
+                pending_records.append(hash_record)
 
-                # Publish to SQS queue
-                sqs_client.send_message(
-                    QueueUrl=OUTPUT_QUEUE_URL,
-                    MessageBody=json.dumps(hash_record.to_sqs_message()),
-                )
+                if len(pending_records) == SQS_MAX_BATCH_SIZE:
+                    publish_hash_records(records_table, pending_records)
+                    published_count += len(pending_records)
+                    pending_records = []
 
-                logger.info("Published new PDQ hash")
+    if pending_records:
+        publish_hash_records(records_table, pending_records)
+        published_count += len(pending_records)
 
+    logger.info("Published %d new PDQ hashes", published_count)
     metrics.flush()
@@ -6,6 +6,8 @@ import os
 import pickle
 import boto3
 import datetime
+import time
+import typing as t
 
 from threatexchange.signal_type.pdq_index import PDQIndex
 
@@ -29,12 +31,34 @@ OUTPUT_TOPIC_ARN = os.environ["PDQ_MATCHES_TOPIC_ARN"]
 
 DYNAMODB_TABLE = os.environ["DYNAMODB_TABLE"]
 
+# Warm lambda containers reuse module state, so a loaded index is kept for
+# this long before being fetched from s3 again.
+INDEX_CACHE_TTL_SECONDS = 60
+
+_index_cache: t.Dict[t.Tuple[str, str], t.Tuple[float, PDQIndex]] = {}
+
 
 def get_index(bucket_name, key):
     """
-    Load the given index from the s3 bucket and deserialize it
+    Load the given index from the s3 bucket and deserialize it. Results are
+    cached for INDEX_CACHE_TTL_SECONDS across invocations of the same container.
     """
-    # TODO Cache this index for a period of time to reduce S3 calls and bandwidth.
+    cached = _index_cache.get((bucket_name, key))
+    if cached is not None:
+        loaded_at, index = cached
+        if time.monotonic() - loaded_at < INDEX_CACHE_TTL_SECONDS:
+            return index
+        # Release the stale index before fetching a new one, otherwise two full
+        # indexes are held in memory while the new one is unpickled.
+        del cached, index
+        _index_cache.pop((bucket_name, key), None)
+
+    result = _download_index(bucket_name, key)
+    _index_cache[(bucket_name, key)] = (time.monotonic(), result)
+    return result
+
+
+def _download_index(bucket_name, key):
     with metrics.timer(metrics.names.pdq_matcher_lambda.download_index):
         with open(LOCAL_INDEX_FILENAME, "wb") as index_file:
             s3_client.download_fileobj(bucket_name, key, index_file)
@@ -66,22 +90,27 @@ def lambda_handler(event, context):
 
         if results:
             match_ids = []
+            match_records = []
             for match in results:
                 metadata = match.metadata
                 logger.info("Match found for key: %s, hash %s -> %s", key, hash_str, metadata)
                 te_id = metadata["id"]
 
-                PDQMatchRecord(
-                    key, hash_str, current_datetime, te_id, metadata["hash"]
-                ).write_to_table(records_table)
+                match_records.append(
+                    PDQMatchRecord(
+                        key, hash_str, current_datetime, te_id, metadata["hash"]
+                    )
+                )
 
                 match_ids.append(te_id)
+
+            PDQMatchRecord.write_many(records_table, match_records)
             sns_client.publish(
                 TopicArn=OUTPUT_TOPIC_ARN,
                 Subject="Match found in pdq_matcher lambda",
                 Message=f"Match found for key: {key}, hash: {hash_str}, for IDs: {match_ids}",
             )
         else:
-            logger.info(f"No matches found for key: {key} hash: {hash_str}")
+            logger.info("No matches found for key: %s hash: %s", key, hash_str)
 
     metrics.flush()
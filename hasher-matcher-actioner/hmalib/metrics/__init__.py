@@ -1,6 +1,5 @@
 import collections
 from contextlib import contextmanager
-from functools import wraps
 import logging
 import time
 import typing as t
@@ -4,8 +4,6 @@ from datetime import datetime
 from enum import Enum
 import typing as t
 
-from hmalib import metrics
-
 
 class AWSCloudWatchUnit(Enum):
     Seconds = "Seconds"
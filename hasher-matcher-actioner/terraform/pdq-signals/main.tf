@@ -210,7 +210,7 @@ data "aws_iam_policy_document" "pdq_hasher" {
   }
   statement {
     effect    = "Allow"
-    actions   = ["dynamodb:PutItem"]
+    actions   = ["dynamodb:PutItem", "dynamodb:BatchWriteItem"]
     resources = [var.datastore.arn]
   }
   statement {
@@ -315,7 +315,7 @@ data "aws_iam_policy_document" "pdq_matcher" {
   }
   statement {
     effect    = "Allow"
-    actions   = ["dynamodb:PutItem"]
+    actions   = ["dynamodb:PutItem", "dynamodb:BatchWriteItem"]
     resources = [var.datastore.arn]
   }
   statement {
@@ -0,0 +1,12 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+import os
+
+# The lambda modules read their configuration from the environment and create
+# boto3 clients at import time.
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("DYNAMODB_TABLE", "test-table")
+os.environ.setdefault("PDQ_HASHES_QUEUE_URL", "https://sqs.test/pdq-hashes")
+os.environ.setdefault("PDQ_MATCHES_TOPIC_ARN", "arn:aws:sns:test:pdq-matches")
+os.environ.setdefault("INDEXES_BUCKET_NAME", "test-indexes")
+os.environ.setdefault("PDQ_INDEX_KEY", "pdq.index")
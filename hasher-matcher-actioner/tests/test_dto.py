@@ -0,0 +1,23 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+import datetime
+from unittest import mock
+
+from hmalib.dto import PDQMatchRecord
+
+
+def test_write_many_uses_batch_writer():
+    table = mock.MagicMock()
+    batch = table.batch_writer.return_value.__enter__.return_value
+    records = [
+        PDQMatchRecord("key", "hash", datetime.datetime(2021, 3, 1), te_id, "te-hash")
+        for te_id in (1, 2)
+    ]
+
+    PDQMatchRecord.write_many(table, records)
+
+    table.batch_writer.assert_called_once_with(overwrite_by_pkeys=["PK", "SK"])
+    assert batch.put_item.call_args_list == [
+        mock.call(Item=record.to_dynamodb_item()) for record in records
+    ]
+    table.put_item.assert_not_called()
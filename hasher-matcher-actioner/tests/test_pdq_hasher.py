@@ -0,0 +1,134 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+import datetime
+import json
+from unittest import mock
+
+import pytest
+
+from hmalib.lambdas.pdq import pdq_hasher
+
+
+def _entries(count):
+    return [{"Id": str(i), "MessageBody": f"body-{i}"} for i in range(count)]
+
+
+def _failure(entry_id, sender_fault=False):
+    return {
+        "Id": entry_id,
+        "SenderFault": sender_fault,
+        "Code": "InvalidParameterValue" if sender_fault else "ServiceUnavailable",
+    }
+
+
+@pytest.fixture
+def sqs_client():
+    with mock.patch.object(pdq_hasher, "sqs_client") as client, mock.patch.object(
+        pdq_hasher.time, "sleep"
+    ):
+        yield client
+
+
+def test_send_message_batch_resends_only_failed_entries(sqs_client):
+    sqs_client.send_message_batch.side_effect = [
+        {"Successful": [], "Failed": [_failure("1")]},
+        {"Successful": [{"Id": "1"}], "Failed": []},
+    ]
+
+    pdq_hasher.send_message_batch(_entries(3))
+
+    calls = sqs_client.send_message_batch.call_args_list
+    assert len(calls) == 2
+    assert calls[0].kwargs["Entries"] == _entries(3)
+    assert calls[1].kwargs["Entries"] == [{"Id": "1", "MessageBody": "body-1"}]
+
+
+def test_send_message_batch_raises_after_all_attempts_fail(sqs_client):
+    sqs_client.send_message_batch.return_value = {
+        "Successful": [],
+        "Failed": [_failure("0")],
+    }
+
+    with mock.patch.object(pdq_hasher.logger, "warning") as warning:
+        with pytest.raises(RuntimeError):
+            pdq_hasher.send_message_batch(_entries(1))
+
+    attempts = pdq_hasher.SQS_MAX_SEND_ATTEMPTS
+    assert sqs_client.send_message_batch.call_count == attempts
+    # No "Resending" log once there is no attempt left
+    assert warning.call_count == attempts - 1
+
+
+def test_send_message_batch_does_not_retry_sender_faults(sqs_client):
+    sqs_client.send_message_batch.return_value = {
+        "Successful": [],
+        "Failed": [_failure("0", sender_fault=True), _failure("1")],
+    }
+
+    with pytest.raises(RuntimeError):
+        pdq_hasher.send_message_batch(_entries(2))
+
+    assert sqs_client.send_message_batch.call_count == 1
+
+
+def test_publish_hash_records_writes_before_publishing(sqs_client):
+    calls = mock.Mock()
+    table = mock.MagicMock()
+    batch = table.batch_writer.return_value.__enter__.return_value
+    batch.put_item.side_effect = lambda **kwargs: calls.put_item(**kwargs)
+    calls.send_message_batch.return_value = {"Successful": [], "Failed": []}
+    sqs_client.send_message_batch.side_effect = calls.send_message_batch
+    records = [
+        pdq_hasher.PipelinePDQHashRecord(
+            f"key-{i}", "hash", datetime.datetime(2021, 3, 1), 100
+        )
+        for i in range(2)
+    ]
+
+    pdq_hasher.publish_hash_records(table, records)
+
+    table.batch_writer.assert_called_once_with(overwrite_by_pkeys=["PK", "SK"])
+    assert [name for name, _, _ in calls.mock_calls] == [
+        "put_item",
+        "put_item",
+        "send_message_batch",
+    ]
+    entries = calls.send_message_batch.call_args.kwargs["Entries"]
+    assert [entry["Id"] for entry in entries] == ["0", "1"]
+    assert [json.loads(entry["MessageBody"]) for entry in entries] == [
+        record.to_sqs_message() for record in records
+    ]
+
+
+def _sqs_record(*s3_objects):
+    s3_records = [
+        {"s3": {"bucket": {"name": "bucket"}, "object": {"key": key, "size": size}}}
+        for key, size in s3_objects
+    ]
+    message = json.dumps({"Records": s3_records})
+    return {"body": json.dumps({"Message": message})}
+
+
+def test_lambda_handler_publishes_in_batches_across_records():
+    event = {
+        "Records": [
+            _sqs_record(*[(f"image-{i}.jpg", 10) for i in range(6)], ("folder/", 0)),
+            _sqs_record(*[(f"image-{i}.jpg", 10) for i in range(6, 11)]),
+        ]
+    }
+    published_keys = []
+
+    with mock.patch.object(pdq_hasher, "s3_client"), mock.patch.object(
+        pdq_hasher, "dynamodb"
+    ), mock.patch.object(
+        pdq_hasher.pdq_hasher, "pdq_from_file", return_value=("hash", 100)
+    ), mock.patch.object(
+        pdq_hasher, "publish_hash_records"
+    ) as publish:
+        publish.side_effect = lambda table, records: published_keys.append(
+            [record.content_key for record in records]
+        )
+        pdq_hasher.lambda_handler(event, None)
+
+    assert [len(keys) for keys in published_keys] == [10, 1]
+    assert sum(published_keys, []) == [f"image-{i}.jpg" for i in range(11)]
@@ -0,0 +1,53 @@
+# Copyright (c) Facebook, Inc. and its affiliates. All Rights Reserved
+
+from unittest import mock
+
+import pytest
+
+from hmalib.lambdas.pdq import pdq_matcher
+
+
+@pytest.fixture
+def download_index():
+    pdq_matcher._index_cache.clear()
+    with mock.patch.object(pdq_matcher, "_download_index") as download:
+        download.side_effect = lambda bucket_name, key: object()
+        yield download
+    pdq_matcher._index_cache.clear()
+
+
+def test_get_index_reuses_index_within_ttl(download_index):
+    with mock.patch.object(pdq_matcher.time, "monotonic", side_effect=[100.0, 159.0]):
+        first = pdq_matcher.get_index("bucket", "key")
+        second = pdq_matcher.get_index("bucket", "key")
+
+    assert first is second
+    download_index.assert_called_once_with("bucket", "key")
+
+
+def test_get_index_refetches_after_ttl(download_index):
+    ttl = pdq_matcher.INDEX_CACHE_TTL_SECONDS
+    with mock.patch.object(
+        pdq_matcher.time, "monotonic", side_effect=[100.0, 100.0 + ttl, 100.0 + ttl]
+    ):
+        first = pdq_matcher.get_index("bucket", "key")
+
+        def download_after_eviction(bucket_name, key):
+            # The stale index must be gone before the new one is loaded
+            assert (bucket_name, key) not in pdq_matcher._index_cache
+            return object()
+
+        download_index.side_effect = download_after_eviction
+        second = pdq_matcher.get_index("bucket", "key")
+
+    assert first is not second
+    assert download_index.call_count == 2
+    assert pdq_matcher._index_cache[("bucket", "key")] == (100.0 + ttl, second)
+
+
+def test_get_index_caches_per_bucket_and_key(download_index):
+    with mock.patch.object(pdq_matcher.time, "monotonic", return_value=100.0):
+        pdq_matcher.get_index("bucket", "key")
+        pdq_matcher.get_index("bucket", "other-key")
+
+    assert download_index.call_count == 2